@@ -1,16 +1,183 @@
 #!/usr/bin/env python3
 import argparse
+import contextlib
+import importlib.util
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import tarfile
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from http.client import HTTPException, HTTPSConnection, RemoteDisconnected
 from pathlib import Path
-from typing import List, Tuple
-from urllib.parse import quote
+from typing import Dict, List, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import quote, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+try:
+    import orjson
+except ImportError:  # optional, only speeds up writing results.json
+    orjson = None
+
+GITHUB_RAW_URL = "https://raw.githubusercontent.com"
+GITHUB_ARCHIVE_URL = "https://github.com/{owner}/{repo}/archive/HEAD.tar.gz"
+HTTP_TIMEOUT = 60
+PIP_CACHE_DIR = Path.home() / ".cache" / "verify_repos_pip"
+UV_CACHE_DIR = Path.home() / ".cache" / "verify_repos_uv"
+VENV_APP_DATA_DIR = Path.home() / ".cache" / "verify_repos_venv"
+TMPFS_DIR = Path("/dev/shm")
+# A venv plus a typical student package's dependencies; wheels stay in the
+# on-disk pip/uv cache. Sized so ubuntu-latest (~8 GB /dev/shm, 4 jobs) fits.
+TMPFS_FREE_PER_JOB = 1024**3
+
+_http_local = threading.local()
+_shared_venv_lock = threading.Lock()
+
+_REPO_RE = re.compile(r"github\.com/([^/]+)/([^/]+?)(?:\.git)?$")
+_SLUG_CLEAN_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_README_RE = re.compile(rb"install|usage", re.IGNORECASE)
+_VCS_VERSION_RE = re.compile(
+    rb"setuptools[_-]scm|hatch-vcs|versioneer|setuptools-git-versioning", re.IGNORECASE
+)
+
+# shields.io endpoint payloads, byte-for-byte what json.dumps(..., indent=2) gave.
+_BADGE_OK = b"""\
+{
+  "schemaVersion": 1,
+  "label": "package",
+  "message": "verified",
+  "color": "brightgreen"
+}
+"""
+_BADGE_FAIL = b"""\
+{
+  "schemaVersion": 1,
+  "label": "package",
+  "message": "failed",
+  "color": "red"
+}
+"""
+
+_HTML_HEAD = """\
+<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>Hall of Fame</title>
+  <style>
+    :root {
+      --bg-1: #ffe8d6;
+      --bg-2: #cce3de;
+      --ink: #1f2933;
+      --accent: #ff6b6b;
+      --accent-2: #3d5a80;
+      --card: #ffffff;
+      --shadow: rgba(31, 41, 51, 0.12);
+    }
+    * { box-sizing: border-box; }
+    body {
+      margin: 0;
+      font-family: "Trebuchet MS", "Gill Sans", "DejaVu Sans", sans-serif;
+      color: var(--ink);
+      background: radial-gradient(circle at top left, var(--bg-1), transparent 60%),
+                  radial-gradient(circle at bottom right, var(--bg-2), transparent 55%),
+                  linear-gradient(135deg, #fef9ef, #f4f1de);
+      min-height: 100vh;
+    }
+    header {
+      padding: 48px 24px 24px;
+      text-align: center;
+    }
+    h1 {
+      margin: 0 0 8px;
+      font-size: clamp(2rem, 4vw, 3.2rem);
+      letter-spacing: 0.02em;
+    }
+    p.subtitle {
+      margin: 0;
+      font-size: 1.05rem;
+      color: var(--accent-2);
+    }
+    .grid {
+      display: grid;
+      gap: 16px;
+      padding: 16px 24px 64px;
+      grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
+    }
+    .card {
+      background: var(--card);
+      padding: 16px;
+      border-radius: 16px;
+      box-shadow: 0 10px 25px var(--shadow);
+      display: grid;
+      gap: 10px;
+      align-content: start;
+      position: relative;
+      overflow: hidden;
+      animation: floatIn 400ms ease-out both;
+    }
+    .card::after {
+      content: "";
+      position: absolute;
+      inset: auto -20% 0;
+      height: 6px;
+      background: linear-gradient(90deg, var(--accent), var(--accent-2));
+    }
+    .repo {
+      text-decoration: none;
+      color: var(--ink);
+      font-weight: 700;
+      word-break: break-word;
+    }
+    .status {
+      font-size: 0.9rem;
+      font-weight: 700;
+      text-transform: uppercase;
+      letter-spacing: 0.08em;
+      display: inline-flex;
+      align-items: center;
+      gap: 6px;
+    }
+    .status .icon { font-size: 1.1rem; }
+    .status.pass { color: #2a9d8f; }
+    .status.pass .icon { color: #2a9d8f; }
+    .status.fail { color: #e63946; }
+    .status.fail .icon { color: #e63946; }
+    .badge {
+      width: fit-content;
+      max-width: 100%;
+      height: auto;
+    }
+    @keyframes floatIn {
+      from { transform: translateY(12px); opacity: 0; }
+      to { transform: translateY(0); opacity: 1; }
+    }
+  </style>
+</head>
+<body>
+  <header>
+    <h1>Hall of Fame</h1>
+    <p class="subtitle">Verified Python packages and their badges.</p>
+  </header>
+  <main class="grid">
+"""
+
+_HTML_EMPTY = "    <p>No repos verified yet.</p>\n"
+
+_HTML_TAIL = """\
+  </main>
+</body>
+</html>
+"""
 
 
 @dataclass
@@ -19,16 +186,33 @@ class RepoResult:
     ok: bool
     reason: str
     badge_path: Path | None = None
+    slug: str = ""
+    badge_url: str = ""
 
 
-def run(cmd: List[str], cwd: Path | None = None) -> Tuple[int, str, str]:
+def dumps_json(obj: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # ensure_ascii=False matches orjson byte-for-byte (raw UTF-8, no \u escapes).
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def run(
+    cmd: List[str],
+    cwd: Path | None = None,
+    env: Dict[str, str] | None = None,
+) -> Tuple[int, str]:
+    # Failure reasons come from stderr; stdout (pip progress, build logs) is
+    # discarded so it is not buffered for every install.
     proc = subprocess.run(
         cmd,
         cwd=str(cwd) if cwd else None,
+        env=env,
         text=True,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
     )
-    return proc.returncode, proc.stdout, proc.stderr
+    return proc.returncode, proc.stderr
 
 
 def read_repo_list(path: Path) -> List[str]:
@@ -41,22 +225,96 @@ def read_repo_list(path: Path) -> List[str]:
     return repos
 
 
-def normalize_repo_slug(url: str) -> str:
-    match = re.search(r"github\.com/([^/]+)/([^/]+?)(?:\.git)?$", url)
+@lru_cache(maxsize=None)
+def parse_owner_repo(url: str) -> Optional[Tuple[str, str]]:
+    match = _REPO_RE.search(url)
     if not match:
-        return re.sub(r"[^A-Za-z0-9._-]+", "_", url)
-    owner, repo = match.group(1), match.group(2)
+        return None
+    return match.group(1), match.group(2)
+
+
+@lru_cache(maxsize=None)
+def normalize_repo_slug(url: str) -> str:
+    owner_repo = parse_owner_repo(url)
+    if not owner_repo:
+        return _SLUG_CLEAN_RE.sub("_", url)
+    owner, repo = owner_repo
     return f"{owner}__{repo}"
 
 
+def https_connection(host: str) -> HTTPSConnection:
+    # One keep-alive connection per host and worker thread, so the TLS
+    # handshake is paid once per thread rather than once per request.
+    conns = getattr(_http_local, "conns", None)
+    if conns is None:
+        conns = _http_local.conns = {}
+    if host not in conns:
+        conns[host] = HTTPSConnection(host, timeout=HTTP_TIMEOUT)
+    return conns[host]
+
+
+def fetch_url(url: str, method: str = "GET") -> Optional[bytes]:
+    """Return the body at an https url, or None if the server answers 404."""
+    parts = urlsplit(url)
+    if "https" in getproxies() and not proxy_bypass(parts.hostname or ""):
+        # http.client ignores proxy settings; let urllib route the request.
+        try:
+            with urlopen(Request(url, method=method), timeout=HTTP_TIMEOUT) as resp:
+                return resp.read()
+        except HTTPError as exc:
+            if exc.code == 404:
+                return None
+            raise
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    for _ in range(2):
+        conn = https_connection(parts.netloc)
+        reused = conn.sock is not None
+        try:
+            conn.request(method, path)
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except (RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server may have dropped an idle keep-alive socket; retry once
+            # on a fresh connection.
+            conn.close()
+            if not reused:
+                raise
+        except (OSError, HTTPException):
+            # Timeouts and other failures are not retried.
+            conn.close()
+            raise
+    if resp.status == 404:
+        return None
+    if resp.status != 200:
+        raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    return body
+
+
+def check_readme(data: bytes) -> Tuple[bool, str]:
+    # Single pass over the raw bytes, stopping once both words have been seen.
+    seen = set()
+    for match in _README_RE.finditer(data):
+        seen.add(match.group().lower())
+        if len(seen) == 2:
+            return True, ""
+    return False, "README.md must include install and usage"
+
+
 def ensure_readme(repo_dir: Path) -> Tuple[bool, str]:
     readme = repo_dir / "README.md"
     if not readme.exists():
         return False, "missing README.md"
-    text = readme.read_text(encoding="utf-8", errors="ignore").lower()
-    if "install" not in text or "usage" not in text:
-        return False, "README.md must include install and usage"
-    return True, ""
+    return check_readme(readme.read_bytes())
+
+
+def uses_vcs_version(repo_dir: Path) -> bool:
+    # Version plugins that read git metadata, which tarball sources lack.
+    for name in ("pyproject.toml", "setup.cfg", "setup.py"):
+        path = repo_dir / name
+        if path.is_file() and _VCS_VERSION_RE.search(path.read_bytes()):
+            return True
+    return False
 
 
 def ensure_pyproject(repo_dir: Path) -> Tuple[bool, str]:
@@ -65,54 +323,140 @@ def ensure_pyproject(repo_dir: Path) -> Tuple[bool, str]:
     return True, ""
 
 
-def create_venv(venv_dir: Path) -> Tuple[bool, str]:
-    code, out, err = run([sys.executable, "-m", "venv", str(venv_dir)])
-    if code != 0:
-        return False, f"venv creation failed: {err.strip() or out.strip()}"
+def remote_precheck(owner: str, repo: str) -> Optional[Tuple[bool, str]]:
+    """Run the pyproject/README checks against raw.githubusercontent.com.
+
+    Returns None when neither file resolves (private, renamed or missing repo)
+    so the caller can fall back to git clone for an accurate error.
+    """
+    base = f"{GITHUB_RAW_URL}/{owner}/{repo}/HEAD"
+    # Only existence matters for pyproject.toml, and the README body is only
+    # worth downloading once the cheaper check has passed.
+    if fetch_url(f"{base}/pyproject.toml", method="HEAD") is None:
+        if fetch_url(f"{base}/README.md", method="HEAD") is None:
+            return None
+        return False, "missing pyproject.toml"
+    readme = fetch_url(f"{base}/README.md")
+    if readme is None:
+        return False, "missing README.md"
+    return check_readme(readme)
+
+
+def download_tarball(owner: str, repo: str, repo_dir: Path) -> bool:
+    """Extract the HEAD tarball of a GitHub repo into repo_dir (no .git)."""
+    extract_dir = repo_dir.parent / "tarball"
+    url = GITHUB_ARCHIVE_URL.format(owner=owner, repo=repo)
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+    try:
+        with urlopen(url, timeout=HTTP_TIMEOUT) as resp:
+            with tarfile.open(fileobj=resp, mode="r|gz") as tar:
+                tar.extractall(extract_dir, **extract_kwargs)
+        if not extract_dir.is_dir():  # empty archive
+            return False
+        # GitHub archives contain a single "<repo>-<sha>/" top-level directory.
+        roots = list(extract_dir.iterdir())
+        if len(roots) != 1 or not roots[0].is_dir():
+            return False
+        roots[0].rename(repo_dir)
+    except (OSError, HTTPException, tarfile.TarError):
+        return False
+    return True
+
+
+def venv_command(venv_dir: Path) -> List[str]:
+    # Prefer uv, then virtualenv with its seed-wheel cache, then stdlib venv.
+    uv = shutil.which("uv")
+    if uv:
+        return [uv, "venv", "--quiet", "--python", sys.executable, str(venv_dir)]
+    if importlib.util.find_spec("virtualenv"):
+        return [
+            sys.executable,
+            "-m",
+            "virtualenv",
+            "--app-data",
+            str(VENV_APP_DATA_DIR),
+            str(venv_dir),
+        ]
+    return [sys.executable, "-m", "venv", str(venv_dir)]
+
+
+def start_venv(venv_dir: Path) -> subprocess.Popen:
+    return subprocess.Popen(
+        venv_command(venv_dir),
+        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+
+def wait_venv(proc: subprocess.Popen) -> Tuple[bool, str]:
+    _, err = proc.communicate()
+    if proc.returncode != 0:
+        return False, f"venv creation failed: {err.strip()}"
     return True, ""
 
 
+def create_venv(venv_dir: Path) -> Tuple[bool, str]:
+    return wait_venv(start_venv(venv_dir))
+
+
 def venv_python(venv_dir: Path) -> Path:
     if os.name == "nt":
         return venv_dir / "Scripts" / "python"
     return venv_dir / "bin" / "python"
 
 
-def install_editable(venv_dir: Path, repo_dir: Path) -> Tuple[bool, str]:
+def pip_env() -> Dict[str, str]:
+    # Share downloaded and built wheels between repos and between runs.
+    env = os.environ.copy()
+    env.setdefault("PIP_CACHE_DIR", str(PIP_CACHE_DIR))
+    env.setdefault("UV_CACHE_DIR", str(UV_CACHE_DIR))  # uv ignores PIP_CACHE_DIR
+    return env
+
+
+def install_editable(
+    venv_dir: Path,
+    repo_dir: Path,
+    wheelhouse: Path | None = None,
+) -> Tuple[bool, str]:
     py = venv_python(venv_dir)
-    code, out, err = run([str(py), "-m", "pip", "install", "-U", "pip"])
-    if code != 0:
-        return False, f"pip upgrade failed: {err.strip() or out.strip()}"
+    env = pip_env()
+    uv = shutil.which("uv")
+    if uv:
+        pip_install = [uv, "pip", "install", "--python", str(py)]
+    else:
+        pip_install = [
+            str(py),
+            "-m",
+            "pip",
+            "install",
+            "--disable-pip-version-check",
+            "--no-input",
+            "--quiet",
+            "--prefer-binary",
+        ]
+    if wheelhouse:
+        pip_install += ["--find-links", str(wheelhouse)]
 
-    requirements = repo_dir / "requirements.txt"
-    if requirements.exists():
-        code, out, err = run([str(py), "-m", "pip", "install", "-r", str(requirements)])
-        if code != 0:
-            return False, f"requirements install failed: {err.strip() or out.strip()}"
+    # One resolver run for requirements.txt and the package itself.
+    targets = ["-e", "."]
+    if (repo_dir / "requirements.txt").exists():
+        targets = ["-r", "requirements.txt"] + targets
 
-    code, out, err = run([str(py), "-m", "pip", "install", "-e", "."], cwd=repo_dir)
+    code, err = run(pip_install + targets, cwd=repo_dir, env=env)
     if code != 0:
-        return False, f"pip install -e . failed: {err.strip() or out.strip()}"
+        return False, f"pip install {' '.join(targets)} failed: {err.strip()}"
 
     return True, ""
 
 
-def write_badge(badges_dir: Path, repo_url: str, ok: bool) -> Path:
-    slug = normalize_repo_slug(repo_url)
+def write_badge(badges_dir: Path, slug: str, ok: bool) -> Path:
     badge_path = badges_dir / f"{slug}.json"
-    status_message = "verified" if ok else "failed"
-    payload = {
-        "schemaVersion": 1,
-        "label": "package",
-        "message": status_message,
-        "color": "brightgreen" if ok else "red",
-    }
-    badge_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    badge_path.write_bytes(_BADGE_OK if ok else _BADGE_FAIL)
     return badge_path
 
 
-def shields_badge_url(badge_base_url: str, repo_url: str) -> str:
-    slug = normalize_repo_slug(repo_url)
+def shields_badge_url(badge_base_url: str, slug: str) -> str:
     raw_url = f"{badge_base_url.rstrip('/')}/{slug}.json"
     return (
         "https://img.shields.io/endpoint"
@@ -120,172 +464,192 @@ def shields_badge_url(badge_base_url: str, repo_url: str) -> str:
     )
 
 
-def verify_repo(repo_url: str, work_dir: Path, badges_dir: Path) -> RepoResult:
-    repo_dir = work_dir / "repo"
-    code, out, err = run(["git", "clone", "--depth", "1", repo_url, str(repo_dir)])
+def clone_repo(repo_url: str, repo_dir: Path) -> Tuple[bool, str]:
+    shutil.rmtree(repo_dir, ignore_errors=True)
+    code, err = run(
+        [
+            "git",
+            "-c",
+            "protocol.version=2",
+            "clone",
+            "--depth=1",
+            "--single-branch",
+            "--no-tags",
+            repo_url,
+            str(repo_dir),
+        ],
+        # Fail instead of waiting for credentials on private/missing repos.
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+    )
     if code != 0:
-        return RepoResult(repo_url, False, f"git clone failed: {err.strip() or out.strip()}")
+        return False, f"git clone failed: {err.strip()}"
+    return True, ""
+
+
+def fetch_source(
+    repo_url: str,
+    repo_dir: Path,
+    owner_repo: Optional[Tuple[str, str]],
+    prechecked: bool,
+) -> Tuple[bool, str]:
+    """Populate repo_dir and run any checks the remote precheck did not cover."""
+    if not (prechecked and download_tarball(*owner_repo, repo_dir)):
+        ok, reason = clone_repo(repo_url, repo_dir)
+        if not ok:
+            return False, reason
+
+    if not prechecked:
+        ok, reason = ensure_pyproject(repo_dir)
+        if not ok:
+            return False, reason
+
+        try:
+            ok, reason = ensure_readme(repo_dir)
+        except Exception as exc:  # defensive: avoid crashing on unexpected README issues
+            return False, f"README check error: {exc}"
+        if not ok:
+            return False, reason
+
+    return True, ""
 
-    ok, reason = ensure_pyproject(repo_dir)
-    if not ok:
-        return RepoResult(repo_url, False, reason)
 
+def verify_repo(
+    repo_url: str,
+    work_dir: Path,
+    wheelhouse: Path | None = None,
+    shared_venv: Path | None = None,
+) -> RepoResult:
+    repo_dir = work_dir / "repo"
+    owner_repo = parse_owner_repo(repo_url)
+    prechecked = False
+    if owner_repo:
+        try:
+            precheck = remote_precheck(*owner_repo)
+        except (OSError, HTTPException):  # network trouble: fall back to git clone
+            precheck = None
+        if precheck is not None:
+            ok, reason = precheck
+            if not ok:
+                return RepoResult(repo_url, False, reason)
+            prechecked = True
+
+    # The venv does not depend on the repo contents, so build it while the
+    # source is downloaded and checked.
+    venv_proc = None if shared_venv else start_venv(work_dir / "venv")
+    ok, reason = False, ""
     try:
-        ok, reason = ensure_readme(repo_dir)
-    except Exception as exc:  # defensive: avoid crashing on unexpected README issues
-        return RepoResult(repo_url, False, f"README check error: {exc}")
+        ok, reason = fetch_source(repo_url, repo_dir, owner_repo, prechecked)
+    finally:
+        if venv_proc and not ok:
+            venv_proc.kill()
+            venv_proc.communicate()
     if not ok:
         return RepoResult(repo_url, False, reason)
 
-    venv_dir = work_dir / "venv"
-    ok, reason = create_venv(venv_dir)
-    if not ok:
-        return RepoResult(repo_url, False, reason)
+    if shared_venv:
+        venv_dir = shared_venv
+        # Concurrent pip runs would corrupt a shared site-packages.
+        install_lock = _shared_venv_lock
+    else:
+        venv_dir = work_dir / "venv"
+        ok, reason = wait_venv(venv_proc)
+        if not ok:
+            return RepoResult(repo_url, False, reason)
+        install_lock = contextlib.nullcontext()
 
     try:
-        ok, reason = install_editable(venv_dir, repo_dir)
+        with install_lock:
+            ok, reason = install_editable(venv_dir, repo_dir, wheelhouse)
+        if not ok and not (repo_dir / ".git").exists() and uses_vcs_version(repo_dir):
+            # Tarball sources carry no git metadata, which setuptools-scm,
+            # hatch-vcs and versioneer need to derive the version; retry once
+            # from a real clone before reporting the failure.
+            cloned, _ = clone_repo(repo_url, repo_dir)
+            if cloned:
+                with install_lock:
+                    ok, reason = install_editable(venv_dir, repo_dir, wheelhouse)
     except Exception as exc:  # catch unexpected installer crashes
         return RepoResult(repo_url, False, f"pip install error: {exc}")
     if not ok:
         return RepoResult(repo_url, False, reason)
 
-    badge_path = write_badge(badges_dir, repo_url, True)
-    return RepoResult(repo_url, True, "ok", badge_path)
-
-
-def write_report(
-    report_path: Path,
-    results: List[RepoResult],
-    badge_base_url: str,
-) -> None:
-    cards = []
-    for result in results:
-        badge_url = shields_badge_url(badge_base_url, result.url)
-        status = "PASS" if result.ok else "FAIL"
-        icon = "&#10003;"  # checkmark
-        cards.append(
-            "\n".join(
-                [
-                    "<article class=\"card\">",
-                    f"  <a class=\"repo\" href=\"{result.url}\">{result.url}</a>",
-                    f"  <div class=\"status {status.lower()}\"><span class=\"icon\">{icon}</span>{status}</div>",
-                    f"  <img class=\"badge\" src=\"{badge_url}\" alt=\"badge\" />",
-                    "</article>",
-                ]
-            )
-        )
+    return RepoResult(repo_url, True, "ok")
 
-    html = "\n".join(
-        [
-            "<!doctype html>",
-            "<html lang=\"en\">",
-            "<head>",
-            "  <meta charset=\"utf-8\" />",
-            "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />",
-            "  <title>Hall of Fame</title>",
-            "  <style>",
-            "    :root {",
-            "      --bg-1: #ffe8d6;",
-            "      --bg-2: #cce3de;",
-            "      --ink: #1f2933;",
-            "      --accent: #ff6b6b;",
-            "      --accent-2: #3d5a80;",
-            "      --card: #ffffff;",
-            "      --shadow: rgba(31, 41, 51, 0.12);",
-            "    }",
-            "    * { box-sizing: border-box; }",
-            "    body {",
-            "      margin: 0;",
-            "      font-family: \"Trebuchet MS\", \"Gill Sans\", \"DejaVu Sans\", sans-serif;",
-            "      color: var(--ink);",
-            "      background: radial-gradient(circle at top left, var(--bg-1), transparent 60%),",
-            "                  radial-gradient(circle at bottom right, var(--bg-2), transparent 55%),",
-            "                  linear-gradient(135deg, #fef9ef, #f4f1de);",
-            "      min-height: 100vh;",
-            "    }",
-            "    header {",
-            "      padding: 48px 24px 24px;",
-            "      text-align: center;",
-            "    }",
-            "    h1 {",
-            "      margin: 0 0 8px;",
-            "      font-size: clamp(2rem, 4vw, 3.2rem);",
-            "      letter-spacing: 0.02em;",
-            "    }",
-            "    p.subtitle {",
-            "      margin: 0;",
-            "      font-size: 1.05rem;",
-            "      color: var(--accent-2);",
-            "    }",
-            "    .grid {",
-            "      display: grid;",
-            "      gap: 16px;",
-            "      padding: 16px 24px 64px;",
-            "      grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));",
-            "    }",
-            "    .card {",
-            "      background: var(--card);",
-            "      padding: 16px;",
-            "      border-radius: 16px;",
-            "      box-shadow: 0 10px 25px var(--shadow);",
-            "      display: grid;",
-            "      gap: 10px;",
-            "      align-content: start;",
-            "      position: relative;",
-            "      overflow: hidden;",
-            "      animation: floatIn 400ms ease-out both;",
-            "    }",
-            "    .card::after {",
-            "      content: \"\";",
-            "      position: absolute;",
-            "      inset: auto -20% 0;",
-            "      height: 6px;",
-            "      background: linear-gradient(90deg, var(--accent), var(--accent-2));",
-            "    }",
-            "    .repo {",
-            "      text-decoration: none;",
-            "      color: var(--ink);",
-            "      font-weight: 700;",
-            "      word-break: break-word;",
-            "    }",
-            "    .status {",
-            "      font-size: 0.9rem;",
-            "      font-weight: 700;",
-            "      text-transform: uppercase;",
-            "      letter-spacing: 0.08em;",
-            "      display: inline-flex;",
-            "      align-items: center;",
-            "      gap: 6px;",
-            "    }",
-            "    .status .icon { font-size: 1.1rem; }",
-            "    .status.pass { color: #2a9d8f; }",
-            "    .status.pass .icon { color: #2a9d8f; }",
-            "    .status.fail { color: #e63946; }",
-            "    .status.fail .icon { color: #e63946; }",
-            "    .badge {",
-            "      width: fit-content;",
-            "      max-width: 100%;",
-            "      height: auto;",
-            "    }",
-            "    @keyframes floatIn {",
-            "      from { transform: translateY(12px); opacity: 0; }",
-            "      to { transform: translateY(0); opacity: 1; }",
-            "    }",
-            "  </style>",
-            "</head>",
-            "<body>",
-            "  <header>",
-            "    <h1>Hall of Fame</h1>",
-            "    <p class=\"subtitle\">Verified Python packages and their badges.</p>",
-            "  </header>",
-            "  <main class=\"grid\">",
-            "\n".join(cards) if cards else "    <p>No repos verified yet.</p>",
-            "  </main>",
-            "</body>",
-            "</html>",
-        ]
+
+def work_root(jobs: int) -> Optional[str]:
+    # Venvs and installs write thousands of short-lived files; keep them in
+    # memory when tmpfs has room for every concurrent job, otherwise use
+    # tempfile's default ($TMPDIR). tmpfs is RAM, so running out means ENOSPC
+    # false failures or an OOM rather than a slower run.
+    try:
+        if not os.access(TMPFS_DIR, os.W_OK):
+            return None
+        if shutil.disk_usage(TMPFS_DIR).free < jobs * TMPFS_FREE_PER_JOB:
+            return None
+    except OSError:
+        return None
+    return str(TMPFS_DIR)
+
+
+def drop_duplicate_repos(repos: List[str]) -> List[str]:
+    # Concurrent workers verifying the same repo would race on one badge file.
+    unique: List[str] = []
+    seen = set()
+    for url in repos:
+        key = parse_owner_repo(url) or url
+        if key in seen:
+            print(f"skipping duplicate repo entry: {url}", file=sys.stderr)
+            continue
+        seen.add(key)
+        unique.append(url)
+    return unique
+
+
+def verify_repo_task(
+    repo_url: str,
+    badges_dir: Path,
+    badge_base_url: str | None = None,
+    wheelhouse: Path | None = None,
+    shared_venv: Path | None = None,
+    tmp_root: str | None = None,
+) -> RepoResult:
+    try:
+        with tempfile.TemporaryDirectory(prefix="verify-", dir=tmp_root) as tmp:
+            result = verify_repo(repo_url, Path(tmp), wheelhouse, shared_venv)
+    except Exception as exc:  # one broken repo must not abort the whole pool
+        result = RepoResult(repo_url, False, f"verification error: {exc}")
+    return record_result(result, badges_dir, badge_base_url)
+
+
+def record_result(
+    result: RepoResult,
+    badges_dir: Path,
+    badge_base_url: str | None = None,
+) -> RepoResult:
+    result.slug = normalize_repo_slug(result.url)
+    if badge_base_url:
+        result.badge_url = shields_badge_url(badge_base_url, result.slug)
+    result.badge_path = write_badge(badges_dir, result.slug, result.ok)
+    return result
+
+
+def render_card(result: RepoResult) -> str:
+    status = "PASS" if result.ok else "FAIL"
+    icon = "&#10003;"  # checkmark
+    return (
+        "<article class=\"card\">\n"
+        f"  <a class=\"repo\" href=\"{result.url}\">{result.url}</a>\n"
+        f"  <div class=\"status {status.lower()}\"><span class=\"icon\">{icon}</span>{status}</div>\n"
+        f"  <img class=\"badge\" src=\"{result.badge_url}\" alt=\"badge\" />\n"
+        "</article>\n"
+    )
+
+
+def write_report(report_path: Path, cards: List[str]) -> None:
+    report_path.write_text(
+        _HTML_HEAD + ("".join(cards) or _HTML_EMPTY) + _HTML_TAIL,
+        encoding="utf-8",
     )
-    report_path.write_text(html + "\n", encoding="utf-8")
 
 
 def main() -> int:
@@ -295,48 +659,108 @@ def main() -> int:
     parser.add_argument("--results", required=True, type=Path)
     parser.add_argument("--report", type=Path)
     parser.add_argument("--badge-base-url", type=str)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="Number of repos to verify concurrently",
+    )
+    parser.add_argument(
+        "--wheelhouse",
+        type=Path,
+        help="Directory of pre-downloaded wheels passed to pip as --find-links",
+    )
+    parser.add_argument(
+        "--shared-venv",
+        action="store_true",
+        help="Install every repo into one venv instead of a fresh one per repo "
+        "(faster, but repos are no longer isolated from each other)",
+    )
     parser.add_argument(
         "--allow-failures",
         action="store_true",
         help="Always exit 0 (still marks failing repos with red badges)",
     )
     args = parser.parse_args()
-
-    repos = read_repo_list(args.repos)
+    if args.wheelhouse:
+        # pip/uv run from inside each temporary checkout, so a relative path
+        # would be looked up there and silently ignored.
+        args.wheelhouse = args.wheelhouse.resolve()
+        if not args.wheelhouse.is_dir():
+            parser.error(f"--wheelhouse {args.wheelhouse} is not a directory")
+
+    repos = drop_duplicate_repos(read_repo_list(args.repos))
     args.badges.mkdir(parents=True, exist_ok=True)
-
-    results: List[RepoResult] = []
-    for repo_url in repos:
-        with tempfile.TemporaryDirectory(prefix="verify-") as tmp:
-            work_dir = Path(tmp)
-            result = verify_repo(repo_url, work_dir, args.badges)
-            if not result.ok:
-                write_badge(args.badges, repo_url, False)
-            results.append(result)
+    badge_base_url = args.badge_base_url.rstrip("/") if args.badge_base_url else None
+
+    jobs = max(1, args.jobs)
+    tmp_root = work_root(jobs)
+
+    results: List[RepoResult]
+    with contextlib.ExitStack() as stack:
+        shared_venv = None
+        venv_error = ""
+        if args.shared_venv:
+            tmp = stack.enter_context(
+                tempfile.TemporaryDirectory(prefix="verify-venv-", dir=tmp_root)
+            )
+            shared_venv = Path(tmp) / "venv"
+            _, venv_error = create_venv(shared_venv)
+
+        if venv_error:
+            # Without the shared venv nothing can be installed; fail every repo
+            # so results.json, badges and the report still reflect the run.
+            results = [
+                record_result(RepoResult(url, False, venv_error), args.badges, badge_base_url)
+                for url in repos
+            ]
+        else:
+            # Each repo is dominated by clone/venv/pip subprocesses, so threads are enough.
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                results = list(
+                    executor.map(
+                        lambda url: verify_repo_task(
+                            url,
+                            args.badges,
+                            badge_base_url,
+                            args.wheelhouse,
+                            shared_venv,
+                            tmp_root,
+                        ),
+                        repos,
+                    )
+                )
+
+    # Tally results.json and render report cards in a single pass.
+    want_report = bool(args.report and badge_base_url)
+    passed = 0
+    failed = []
+    cards: List[str] = []
+    for r in results:
+        if r.ok:
+            passed += 1
+        else:
+            failed.append({"url": r.url, "reason": r.reason})
+        if want_report:
+            cards.append(render_card(r))
 
     payload = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "total": len(results),
-        "passed": sum(1 for r in results if r.ok),
-        "failed": [
-            {"url": r.url, "reason": r.reason}
-            for r in results
-            if not r.ok
-        ],
+        "passed": passed,
+        "failed": failed,
     }
-    args.results.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    args.results.write_bytes(dumps_json(payload) + b"\n")
 
-    if args.report and args.badge_base_url:
-        write_report(args.report, results, args.badge_base_url.rstrip("/"))
+    if want_report:
+        write_report(args.report, cards)
 
-    for r in results:
-        status = "PASS" if r.ok else "FAIL"
-        print(f"{status} {r.url} {r.reason}")
+    if results:
+        print("\n".join(f"{'PASS' if r.ok else 'FAIL'} {r.url} {r.reason}" for r in results))
 
-    all_ok = all(r.ok for r in results)
     if args.allow_failures:
         return 0
-    return 0 if all_ok else 1
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":